@@ -1,15 +1,13 @@
 """
 Pytest configuration and fixtures for FastMCP-based PromptYoSelf server tests.
-Replaces legacy Sanctum plugin-host fixtures with FastMCP in-memory and HTTP client fixtures.
+Replaces legacy Sanctum plugin-host fixtures with the FastMCP in-memory client fixture.
+The HTTP server and client fixtures live in tests/e2e/conftest.py.
 """
 
 import os
 import sys
-import time
-import httpx
 import pytest
 import asyncio
-import subprocess
 import pytest_asyncio
 from pathlib import Path
 
@@ -40,11 +38,30 @@ def event_loop():
     loop.close()
 
 
-@pytest_asyncio.fixture
+@pytest.fixture(autouse=True)
+def reset_default_agent():
+    """
+    Undo default-agent state written by set_default_agent tools.
+    The in-memory client is shared across the session, so LETTA_AGENT_ID and the
+    scoped defaults must not leak from one test into the next.
+    """
+    saved = os.environ.get("LETTA_AGENT_ID")
+    yield
+    if saved is None:
+        os.environ.pop("LETTA_AGENT_ID", None)
+    else:
+        os.environ["LETTA_AGENT_ID"] = saved
+    server = sys.modules.get("promptyoself_mcp_server")
+    if server is not None:
+        server._SCOPED_AGENT_DEFAULTS.clear()
+
+
+@pytest_asyncio.fixture(scope="session")
 async def mcp_in_memory_client():
     """
     Fast, in-process client using FastMCP's in-memory transport.
     Ideal for unit/integration tests without starting a subprocess or binding ports.
+    Session-scoped; per-test state is reset by ``reset_default_agent``.
     """
     try:
         from fastmcp import Client
@@ -59,96 +76,3 @@ async def mcp_in_memory_client():
     client = Client(srv.mcp)  # in-memory transport by passing server instance
     async with client:
         yield client
-
-
-def _wait_for_server(base_url: str, timeout: int = 10) -> bool:
-    """
-    Wait for the server to respond to HTTP requests.
-    
-    Args:
-        base_url: The base URL of the server (e.g., http://127.0.0.1:8100/mcp)
-        timeout: Maximum time to wait in seconds
-        
-    Returns:
-        True if server is responsive, False otherwise
-    """
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        try:
-            # Try a simple GET request to see if server is responsive
-            response = httpx.get(f"{base_url}/", timeout=1.0)
-            # If we get any response (even 404), the server is running
-            return True
-        except Exception:
-            # Server not ready yet, wait a bit and try again
-            time.sleep(0.5)
-    return False
-
-
-@pytest.fixture
-def http_server_process(tmp_path):
-    """
-    Start the FastMCP server (HTTP transport) as a subprocess for E2E tests.
-    Uses 127.0.0.1:8100 by default to avoid conflicts.
-    """
-    host = os.environ.get("TEST_MCP_HOST", "127.0.0.1")
-    port = os.environ.get("TEST_MCP_PORT", "8100")
-    path = os.environ.get("TEST_MCP_PATH", "/mcp")
-
-    cmd = [
-        sys.executable,
-        "promptyoself_mcp_server.py",
-        "--transport",
-        "http",
-        "--host",
-        host,
-        "--port",
-        port,
-        "--path",
-        path,
-    ]
-
-    proc = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        cwd=str(PROJECT_ROOT),
-        text=True,
-    )
-
-    base_url = f"http://{host}:{port}{path}"
-    
-    # Give the server time to bind the port and start responding
-    time.sleep(1.0)  # Initial wait
-    
-    # Check if the process is still running
-    if proc.poll() is not None:
-        # Process has terminated, collect output for debugging
-        stdout, stderr = proc.communicate()
-        raise RuntimeError(f"Server process terminated unexpectedly.\nSTDOUT:\n{stdout}\nSTDERR:\n{stderr}")
-    
-    # Wait for server to be responsive
-    if not _wait_for_server(base_url, timeout=10):
-        # Server didn't start in time, collect output for debugging
-        try:
-            stdout, stderr = proc.communicate(timeout=5)
-        except subprocess.TimeoutExpired:
-            # If we can't get output even after 5 seconds, terminate the process
-            proc.kill()
-            stdout, stderr = proc.communicate()
-        raise RuntimeError(f"Server failed to start within timeout period.\nSTDOUT:\n{stdout}\nSTDERR:\n{stderr}")
-
-    yield {
-        "process": proc,
-        "host": host,
-        "port": int(port),
-        "path": path,
-        "base_url": base_url,
-    }
-
-    # Cleanup
-    try:
-        proc.terminate()
-        proc.wait(timeout=10)
-    except Exception:
-        proc.kill()
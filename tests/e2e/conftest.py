@@ -0,0 +1,184 @@
+"""
+Fixtures for HTTP end-to-end tests.
+
+The FastMCP server is started once per session as a real subprocess and a
+single connected FastMCP client is shared by the tests in this package.
+"""
+
+import os
+import sys
+import time
+import httpx
+import signal
+import socket
+import pytest
+import subprocess
+import pytest_asyncio
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _wait_for_server(base_url: str, proc: subprocess.Popen, timeout: float = 10.0) -> bool:
+    """
+    Poll the server until it responds to HTTP requests.
+
+    Probes with a bare TCP connect (cheap, no HTTP stack) until the port is
+    bound, then confirms with a single HTTP request.
+
+    Args:
+        base_url: The base URL of the server (e.g., http://127.0.0.1:8100/mcp)
+        proc: The server process; polling stops early if it exits
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        True if server is responsive, False otherwise
+    """
+    url = httpx.URL(base_url)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            return False
+        try:
+            socket.create_connection((url.host, url.port), timeout=0.1).close()
+            break
+        except OSError:
+            # Not listening yet; retry shortly
+            time.sleep(0.025)
+    else:
+        return False
+
+    # One client for all attempts so each retry doesn't rebuild pool/SSL state
+    with httpx.Client(timeout=0.5) as client:
+        while time.monotonic() < deadline:
+            try:
+                # Any response (even 404/406) means the server is accepting requests
+                client.get(f"{base_url}/")
+                return True
+            except httpx.TransportError:
+                time.sleep(0.025)
+    return False
+
+
+def _kill_server(proc: subprocess.Popen) -> None:
+    """
+    Hard-stop the server and anything it spawned (e.g. the executor loop).
+
+    Tests don't need a graceful shutdown, so skip SIGTERM and draining.
+    The server runs in its own session, so its process group is killed.
+    """
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except ProcessLookupError:
+        pass
+    try:
+        proc.wait(timeout=1.0)
+    except subprocess.TimeoutExpired:
+        pass
+
+
+def _xdist_worker_index() -> int:
+    """Return the pytest-xdist worker index (0 when not running under xdist)."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    try:
+        return int(worker.removeprefix("gw"))
+    except ValueError:
+        return 0
+
+
+@pytest.fixture(scope="session")
+def http_server_process(tmp_path_factory):
+    """
+    Start the FastMCP server (HTTP transport) as a subprocess for E2E tests.
+    Uses 127.0.0.1:8100 by default to avoid conflicts; under pytest-xdist each
+    worker gets its own port (8100 + worker index) and server.
+
+    Session-scoped: the server is started once and shared by all HTTP E2E
+    tests, which only talk to it through independent client sessions.
+    """
+    host = os.environ.get("TEST_MCP_HOST", "127.0.0.1")
+    port = os.environ.get("TEST_MCP_PORT") or str(8100 + _xdist_worker_index())
+    path = os.environ.get("TEST_MCP_PATH", "/mcp")
+
+    cmd = [
+        sys.executable,
+        "promptyoself_mcp_server.py",
+        "--transport",
+        "http",
+        "--host",
+        host,
+        "--port",
+        port,
+        "--path",
+        path,
+    ]
+
+    server_dir = tmp_path_factory.mktemp("mcp_server")
+
+    # Child env is built once per session; the DB and log dir point into the
+    # session temp dir so the server never writes into the working tree.
+    env = {
+        **os.environ,
+        "PROMPTYOSELF_DB": str(server_dir / "promptyoself.db"),
+        "PROMPTYOSELF_LOG_DIR": str(server_dir / "logs"),
+    }
+
+    # Server output goes to a file rather than an undrained PIPE, which could
+    # fill up and block the server; it is only read back on startup failure.
+    # The child inherits its own descriptor, so the parent's handle is closed
+    # as soon as Popen returns (or raises).
+    log_path = server_dir / "server.log"
+    with open(log_path, "wb") as log_file:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            cwd=str(PROJECT_ROOT),
+            env=env,
+            start_new_session=True,
+        )
+
+    base_url = f"http://{host}:{port}{path}"
+
+    # Wait for server to be responsive (returns as soon as the port answers)
+    if not _wait_for_server(base_url, proc, timeout=10):
+        if proc.poll() is not None:
+            reason = "Server process terminated unexpectedly."
+        else:
+            reason = "Server failed to start within timeout period."
+        _kill_server(proc)
+        output = log_path.read_text(errors="replace")
+        raise RuntimeError(f"{reason}\nOUTPUT:\n{output}")
+
+    yield {
+        "process": proc,
+        "host": host,
+        "port": int(port),
+        "path": path,
+        "base_url": base_url,
+    }
+
+    # Cleanup
+    _kill_server(proc)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def http_client(http_server_process):
+    """
+    Yield a connected FastMCP client that talks to the spawned HTTP server.
+    http_server_process fixture provides base_url like http://127.0.0.1:8100/mcp
+
+    Session-scoped so the MCP initialize handshake happens once for all
+    HTTP E2E tests.
+    """
+    try:
+        from fastmcp import Client
+    except ImportError as e:
+        pytest.skip(f"fastmcp is required for E2E tests: {e}")
+
+    client = Client(http_server_process["base_url"])
+    async with client:
+        yield client
@@ -9,6 +9,7 @@ import pytest
 import os
 import tempfile
 import time
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch, Mock
 
 
@@ -50,11 +51,12 @@ class TestAuthenticationE2E:
                         "prompt": "Authentication test with correct password",
                         "time": "2025-12-25T10:00:00Z"
                     })
+                    data = result.structured_content
 
                     # Should succeed
-                    assert "error" not in result.structured_content
-                    assert result.structured_content["status"] == "success"
-                    assert result.structured_content["id"] == 6001
+                    assert "error" not in data
+                    assert data["status"] == "success"
+                    assert data["id"] == 6001
 
     @pytest.mark.asyncio
     async def test_authentication_with_legacy_password_format(self, mcp_in_memory_client, monkeypatch):
@@ -69,10 +71,11 @@ class TestAuthenticationE2E:
             mock_client_getter.side_effect = Exception("401 Unauthorized")
 
             result = await mcp_in_memory_client.call_tool("promptyoself_test")
+            data = result.structured_content
 
             # Should report authentication error (different structure for test tool)
-            assert result.structured_content["status"] == "error"
-            assert "401" in result.structured_content["message"] or "Unauthorized" in result.structured_content["message"]
+            assert data["status"] == "error"
+            assert "401" in data["message"] or "Unauthorized" in data["message"]
 
     @pytest.mark.asyncio
     async def test_environment_variable_loading_priority(self, mcp_in_memory_client, monkeypatch):
@@ -129,10 +132,11 @@ class TestAuthenticationE2E:
 
             # Test the agents tool
             result = await mcp_in_memory_client.call_tool("promptyoself_agents")
+            data = result.structured_content
 
-            assert result.structured_content["status"] == "success"
-            assert len(result.structured_content["agents"]) > 0
-            agent_ids = [agent["id"] for agent in result.structured_content["agents"]]
+            assert data["status"] == "success"
+            assert len(data["agents"]) > 0
+            agent_ids = [agent["id"] for agent in data["agents"]]
             assert "agent-ff18d65c-1f8f-4ca7-9013-2e4e526fd2f4" in agent_ids
 
     @pytest.mark.asyncio
@@ -173,12 +177,13 @@ class TestAuthenticationE2E:
         monkeypatch.setenv("LETTA_BASE_URL", "http://localhost:8283")
 
         result = await mcp_in_memory_client.call_tool("health")
+        data = result.structured_content
 
-        assert result.structured_content["status"] == "healthy"
+        assert data["status"] == "healthy"
         
         # Should show authentication is configured
-        assert result.structured_content["auth_set"] is True
-        assert result.structured_content["letta_base_url"] == "http://localhost:8283"
+        assert data["auth_set"] is True
+        assert data["letta_base_url"] == "http://localhost:8283"
 
     @pytest.mark.asyncio
     async def test_inference_diagnostics_comprehensive(self, mcp_in_memory_client, monkeypatch):
@@ -201,15 +206,16 @@ class TestAuthenticationE2E:
             }
 
             result = await mcp_in_memory_client.call_tool("promptyoself_inference_diagnostics")
+            data = result.structured_content
 
             # Should provide complete diagnostic information
-            assert result.structured_content["status"] == "ok"
-            assert "env" in result.structured_content
-            assert "single_agent_fallback_enabled" in result.structured_content
-            assert "agents_count" in result.structured_content
+            assert data["status"] == "ok"
+            assert "env" in data
+            assert "single_agent_fallback_enabled" in data
+            assert "agents_count" in data
 
             # Check environment variable status
-            env_info = result.structured_content["env"]
+            env_info = data["env"]
             assert env_info["LETTA_AGENT_ID"]["set"] is True
             assert env_info["LETTA_AGENT_ID"]["value"] == test_agent
             
@@ -221,8 +227,8 @@ class TestAuthenticationE2E:
                 assert "***" in password_value or len(password_value) < 20  # Should be masked
 
             # Check single agent fallback
-            assert result.structured_content["single_agent_fallback_enabled"] is True
-            assert result.structured_content["agents_count"] == 1
+            assert data["single_agent_fallback_enabled"] is True
+            assert data["agents_count"] == 1
 
     @pytest.mark.asyncio
     async def test_authentication_error_handling(self, mcp_in_memory_client, monkeypatch):
@@ -236,10 +242,11 @@ class TestAuthenticationE2E:
             mock_client_getter.side_effect = Exception("401 Client Error: Unauthorized")
 
             result = await mcp_in_memory_client.call_tool("promptyoself_test")
+            data = result.structured_content
 
             # Should return structured error response (test tool has different structure)
-            assert result.structured_content["status"] == "error"
-            error_message = result.structured_content["message"]
+            assert data["status"] == "error"
+            error_message = data["message"]
             assert "401" in error_message or "Unauthorized" in error_message
             assert "Client Error" in error_message
 
@@ -277,8 +284,9 @@ class TestAuthenticationE2E:
                     
                     # All should succeed
                     for i, result in enumerate(results):
-                        assert "error" not in result.structured_content, f"Request {i} failed"
-                        assert result.structured_content["status"] == "success"
+                        data = result.structured_content
+                        assert "error" not in data, f"Request {i} failed"
+                        assert data["status"] == "success"
 
                     # Should have been called 3 times (once per request)
                     assert mock_register.call_count == 3
@@ -345,10 +353,11 @@ class TestAuthenticationE2E:
             "prompt": "Missing env vars test",
             "time": "2025-12-30T10:00:00Z"
         })
+        data = result.structured_content
 
         # Should return informative error
-        assert "error" in result.structured_content
-        error_message = result.structured_content["error"]
+        assert "error" in data
+        error_message = data["error"]
         assert "agent_id" in error_message.lower()
         assert any(word in error_message.lower() for word in ["required", "missing", "provide"])
 
@@ -378,15 +387,16 @@ class TestAuthenticationE2E:
                     result = await mcp_in_memory_client.call_tool("promptyoself_schedule_time", {
                         "agent_id": "db-auth-test-agent",
                         "prompt": "Database authentication test",
-                        "time": "2025-12-31T10:00:00Z",
+                        "time": (datetime.now(timezone.utc) + timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%SZ"),
                         "skip_validation": True  # Skip Letta API validation
                     })
+                    data = result.structured_content
 
                     # Should succeed and return actual database ID
-                    assert "error" not in result.structured_content
-                    assert result.structured_content["status"] == "success" 
-                    assert "id" in result.structured_content
-                    assert isinstance(result.structured_content["id"], int)
+                    assert "error" not in data
+                    assert data["status"] == "success" 
+                    assert "id" in data
+                    assert isinstance(data["id"], int)
 
         finally:
             # Clean up
@@ -4,8 +4,9 @@ using the official FastMCP Client instead of raw HTTP JSON-RPC.
 """
 
 import json
+import uuid
 import pytest
-import pytest_asyncio
+from datetime import datetime, timedelta, timezone
 
 # Mark module as e2e for marker-based selection
 pytestmark = pytest.mark.e2e
@@ -18,17 +19,6 @@ except Exception:
 
 @pytest.mark.skipif(Client is None, reason="fastmcp is required for E2E tests")
 class TestMCPWorkflowHTTP:
-    @pytest_asyncio.fixture
-    async def http_client(self, http_server_process):
-        """
-        Yield a connected FastMCP client that talks to the spawned HTTP server.
-        http_server_process fixture provides base_url like http://127.0.0.1:8100/mcp
-        """
-        base_url = http_server_process["base_url"]
-        client = Client(base_url)
-        async with client:
-            yield client
-
     @pytest.mark.asyncio
     async def test_list_tools_and_call_health(self, http_client: "Client"):
         # List tools
@@ -62,13 +52,16 @@ class TestMCPWorkflowHTTP:
 
     @pytest.mark.asyncio
     async def test_full_workflow(self, http_client: "Client"):
+        # Unique agent per run: the server and client are shared across the session
+        agent_id = f"e2e-test-agent-{uuid.uuid4().hex[:8]}"
+
         # 1. Register a prompt
         register_result = await http_client.call_tool(
             "promptyoself_schedule_time",
             {
-                "agent_id": "e2e-test-agent",
+                "agent_id": agent_id,
                 "prompt": "e2e test prompt",
-                "time": "2025-12-31T23:59:59",
+                "time": (datetime.now(timezone.utc) + timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%S"),
                 "skip_validation": True,
             },
         )
@@ -78,7 +71,7 @@ class TestMCPWorkflowHTTP:
 
         # 2. List prompts and verify the new one is there
         list_result = await http_client.call_tool(
-            "promptyoself_list", {"agent_id": "e2e-test-agent"}
+            "promptyoself_list", {"agent_id": agent_id}
         )
         list_data = list_result.structured_content
         assert list_data["status"] == "success"
@@ -94,7 +87,7 @@ class TestMCPWorkflowHTTP:
         # 4. List prompts again (including cancelled) and verify it's inactive
         list_all_result = await http_client.call_tool(
             "promptyoself_list",
-            {"agent_id": "e2e-test-agent", "include_cancelled": True},
+            {"agent_id": agent_id, "include_cancelled": True},
         )
         list_all_data = list_all_result.structured_content
         cancelled_schedule = next(
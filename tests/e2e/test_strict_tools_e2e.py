@@ -1,47 +1,17 @@
-import os
+import sys
+import types
 import pytest
+from datetime import datetime, timedelta, timezone
 
 TEST_AGENT = "agent-1a4a5989-ab98-478f-9b1f-bbece814ed7a"
+# Relative so the "time" case never falls into the past
+FUTURE_TIME = (datetime.now(timezone.utc) + timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
-@pytest.mark.asyncio
-async def test_e2e_schedule_time_through_cli(monkeypatch, mcp_in_memory_client):
+@pytest.fixture
+def stub_cli(monkeypatch):
+    """Stub letta_client and patch CLI validation/persistence to avoid DB/HTTP."""
     # Stub letta_client before importing CLI to avoid external dependency
-    import sys
-    import types
-    fake_letta = types.SimpleNamespace(Letta=object, MessageCreate=object, TextContent=object)
-    monkeypatch.setitem(sys.modules, 'letta_client', fake_letta)
-    # Patch CLI validation and persistence to avoid DB/HTTP
-    import promptyoself.cli as cli
-
-    def _ok_validate(agent_id: str):
-        return {"status": "success", "exists": True, "agent_id": agent_id}
-
-    def _fake_add_schedule(agent_id, prompt_text, schedule_type, schedule_value, next_run, max_repetitions=None):
-        # return a deterministic id
-        return 301
-
-    monkeypatch.setattr(cli, "validate_agent_exists", _ok_validate)
-    monkeypatch.setattr(cli, "add_schedule", _fake_add_schedule)
-
-    # Use env inference for agent_id
-    monkeypatch.setenv("LETTA_AGENT_ID", TEST_AGENT)
-
-    payload = {
-        "prompt": "End-to-end time schedule",
-        "time": "2025-12-25T10:00:00Z",
-        "agent_id": None,
-    }
-    result = await mcp_in_memory_client.call_tool("promptyoself_schedule_time", payload)
-    assert result.structured_content["status"] == "success"
-    assert result.structured_content["id"] == 301
-    assert "next_run" in result.structured_content
-
-
-@pytest.mark.asyncio
-async def test_e2e_schedule_cron_through_cli(monkeypatch, mcp_in_memory_client):
-    import sys
-    import types
     fake_letta = types.SimpleNamespace(Letta=object, MessageCreate=object, TextContent=object)
     monkeypatch.setitem(sys.modules, 'letta_client', fake_letta)
     import promptyoself.cli as cli
@@ -50,48 +20,46 @@ async def test_e2e_schedule_cron_through_cli(monkeypatch, mcp_in_memory_client):
         return {"status": "success", "exists": True, "agent_id": agent_id}
 
     def _fake_add_schedule(agent_id, prompt_text, schedule_type, schedule_value, next_run, max_repetitions=None):
-        return 302
+        # return a deterministic id per schedule type
+        return {"once": 301, "cron": 302, "interval": 303}[schedule_type]
 
     monkeypatch.setattr(cli, "validate_agent_exists", _ok_validate)
     monkeypatch.setattr(cli, "add_schedule", _fake_add_schedule)
-    monkeypatch.setenv("PROMPTYOSELF_DEFAULT_AGENT_ID", TEST_AGENT)
-
-    payload = {
-        "prompt": "End-to-end cron schedule",
-        "cron": "*/10 * * * *",
-        "agent_id": None,
-    }
-    result = await mcp_in_memory_client.call_tool("promptyoself_schedule_cron", payload)
-    assert result.structured_content["status"] == "success"
-    assert result.structured_content["id"] == 302
-    assert "next_run" in result.structured_content
 
 
 @pytest.mark.asyncio
-async def test_e2e_schedule_every_through_cli(monkeypatch, mcp_in_memory_client):
-    import sys
-    import types
-    fake_letta = types.SimpleNamespace(Letta=object, MessageCreate=object, TextContent=object)
-    monkeypatch.setitem(sys.modules, 'letta_client', fake_letta)
-    import promptyoself.cli as cli
-
-    def _ok_validate(agent_id: str):
-        return {"status": "success", "exists": True, "agent_id": agent_id}
-
-    def _fake_add_schedule(agent_id, prompt_text, schedule_type, schedule_value, next_run, max_repetitions=None):
-        return 303
-
-    monkeypatch.setattr(cli, "validate_agent_exists", _ok_validate)
-    monkeypatch.setattr(cli, "add_schedule", _fake_add_schedule)
-
-    # No env needed if explicit agent passed
-    payload = {
-        "agent_id": TEST_AGENT,
-        "prompt": "End-to-end every schedule",
-        "every": "2m",
-        "max_repetitions": 1,
-    }
-    result = await mcp_in_memory_client.call_tool("promptyoself_schedule_every", payload)
-    assert result.structured_content["status"] == "success"
-    assert result.structured_content["id"] == 303
-    assert "next_run" in result.structured_content
+@pytest.mark.parametrize(
+    "tool,payload,agent_env,expected_id",
+    [
+        (
+            # Use env inference for agent_id
+            "promptyoself_schedule_time",
+            {"prompt": "End-to-end time schedule", "time": FUTURE_TIME, "agent_id": None},
+            "LETTA_AGENT_ID",
+            301,
+        ),
+        (
+            "promptyoself_schedule_cron",
+            {"prompt": "End-to-end cron schedule", "cron": "*/10 * * * *", "agent_id": None},
+            "PROMPTYOSELF_DEFAULT_AGENT_ID",
+            302,
+        ),
+        (
+            # No env needed if explicit agent passed
+            "promptyoself_schedule_every",
+            {"agent_id": TEST_AGENT, "prompt": "End-to-end every schedule", "every": "2m", "max_repetitions": 1},
+            None,
+            303,
+        ),
+    ],
+    ids=["time", "cron", "every"],
+)
+async def test_e2e_schedule_through_cli(stub_cli, monkeypatch, mcp_in_memory_client, tool, payload, agent_env, expected_id):
+    if agent_env:
+        monkeypatch.setenv(agent_env, TEST_AGENT)
+
+    result = await mcp_in_memory_client.call_tool(tool, payload)
+    data = result.structured_content
+    assert data["status"] == "success"
+    assert data["id"] == expected_id
+    assert "next_run" in data
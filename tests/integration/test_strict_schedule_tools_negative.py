@@ -42,8 +42,9 @@ async def test_schedule_time_in_past_returns_error(mcp_in_memory_client, monkeyp
         "agent_id": None,
     }
     result = await mcp_in_memory_client.call_tool("promptyoself_schedule_time", payload)
-    assert "error" in result.structured_content
-    assert "future" in result.structured_content["error"].lower()
+    data = result.structured_content
+    assert "error" in data
+    assert "future" in data["error"].lower()
 
 
 @pytest.mark.asyncio
@@ -62,8 +63,9 @@ async def test_schedule_cron_invalid_expression(mcp_in_memory_client, monkeypatc
         "agent_id": None,
     }
     result = await mcp_in_memory_client.call_tool("promptyoself_schedule_cron", payload)
-    assert "error" in result.structured_content
-    assert "invalid cron" in result.structured_content["error"].lower()
+    data = result.structured_content
+    assert "error" in data
+    assert "invalid cron" in data["error"].lower()
 
 
 @pytest.mark.asyncio
@@ -81,8 +83,9 @@ async def test_schedule_every_invalid_interval(mcp_in_memory_client, monkeypatch
         "every": "5x",  # invalid suffix
     }
     result = await mcp_in_memory_client.call_tool("promptyoself_schedule_every", payload)
-    assert "error" in result.structured_content
-    assert "invalid interval" in result.structured_content["error"].lower()
+    data = result.structured_content
+    assert "error" in data
+    assert "invalid interval" in data["error"].lower()
 
 
 @pytest.mark.asyncio